@@ -1,12 +1,6 @@
-import logging
-import sys
+from .utils import logger, _init_logger
 
-from rich.console import Console
-from rich.logging import RichHandler
-
-logger: logging.Logger = logging.getLogger('anterior')
-console = Console(file=sys.stdout, force_terminal=True)
-logger.addHandler(RichHandler(tracebacks_show_locals=True, console=console))
+console = _init_logger()
 
 from .source import *
 from .warp import *
@@ -0,0 +1,30 @@
+import datetime
+from typing import Optional
+
+_NOW: Optional[datetime.datetime] = None
+
+
+def set(now: Optional[datetime.datetime]) -> None:
+    """
+    Sets the current datetime seen by the data sources.
+
+    Parameters
+    ----------
+    now : datetime.datetime, optional
+        The simulated datetime to report. Timezone-aware datetimes are stored as naive wall-clock time in their own
+        timezone. Pass None to fall back to the system clock.
+    """
+    global _NOW
+    _NOW = None if now is None else now.replace(tzinfo=None)
+
+
+def get() -> datetime.datetime:
+    """
+    Returns the current datetime seen by the data sources.
+
+    Returns
+    -------
+    datetime.datetime
+        The naive datetime set by the running backtest, or the system's local time if no backtest is running.
+    """
+    return datetime.datetime.now() if _NOW is None else _NOW
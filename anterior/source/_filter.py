@@ -0,0 +1,68 @@
+import datetime
+from functools import wraps
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from anterior import clock
+
+_RENDERED = ("__repr__", "__str__")
+
+
+def _clock_cached(method: Callable) -> Callable:
+    """
+    Caches the result of a no-argument method on its instance until the clock moves.
+
+    :param Callable method: method to cache, its instance must define a `_clock_cache` dict
+    :return: the caching method
+    :rtype: Callable
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def inner(self):
+        now = clock.get()
+        cached = self._clock_cache.get(name)
+
+        # The clock only moves between backtest jobs, so the result is reused until the time advances
+        if cached is None or cached[0] != now:
+            cached = self._clock_cache[name] = (now, method(self))
+
+        return cached[1]
+
+    return inner
+
+
+def _clear_rendered(cache: dict) -> None:
+    """
+    Drops the cached text of an Oracle object after its filtered view was modified in place. The view itself is kept,
+    since it holds the modification.
+
+    :param dict cache: the object's `_clock_cache`
+    """
+    for name in _RENDERED:
+        cache.pop(name, None)
+
+
+def _sorted_cutoff(dates: pd.Index) -> Optional[Callable[[datetime.datetime], int]]:
+    """
+    Returns a function counting the dates at or before a datetime, or None if the dates are not sorted datetimes.
+
+    Time series are almost always sorted, which allows slicing at a binary-searched cutoff instead of masking.
+
+    :param pd.Index dates: dates to search
+    :return: the cutoff function, if the dates are sorted
+    :rtype: Callable, optional
+    """
+    if not (pd.api.types.is_datetime64_dtype(dates) and dates.is_monotonic_increasing):
+        return None
+
+    # Raw int64 timestamps in the index's own unit, searched without any datetime boxing
+    dates_i8 = dates.asi8
+    unit = np.datetime_data(dates.dtype)[0]
+
+    def cutoff(now: datetime.datetime) -> int:
+        return dates_i8.searchsorted(np.datetime64(now, unit).astype(np.int64), side="right")
+
+    return cutoff
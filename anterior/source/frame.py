@@ -4,6 +4,12 @@ from typing import Hashable
 import pandas as pd
 import polars as pl
 
+from anterior import clock
+from ._filter import _clock_cached, _clear_rendered, _sorted_cutoff
+
+_INTERNAL_ATTRIBUTES = frozenset({'_df', '_date_col', '_use_index', '_past', '_columns', '_dates', '_sorted', '_filter',
+                                  '_cutoff', '_clock_cache'})
+
 
 class OracleDataFrame:
     """
@@ -15,7 +21,7 @@ class OracleDataFrame:
     df : pd.DataFrame | pl.DataFrame
         The DataFrame to use as the data source.
     date_col : str, optional
-        The name of the column containing dates. Defaults to the index.
+        The name of the column containing dates. Defaults to the index. Required for polars DataFrames.
     past : bool, optional
         If True, the OracleDataFrame will return only the data before the current date.
         If False, it will return only the data after the current date.
@@ -70,8 +76,52 @@ class OracleDataFrame:
 
         self._df = df
         self._date_col = date_col
+        self._use_index = date_col == "index"
+        self._clock_cache = {}
         self.past = past
 
+        # Membership on a DataFrame tests column labels, which do not depend on the current date
+        self._columns = frozenset(df.columns)
+
+        # The filter matching the backend and sortedness is picked once here so the hot path does not branch on it
+        if isinstance(df, pd.DataFrame):
+            self._dates = df.index if self._use_index else pd.Index(df[date_col])
+            self._cutoff = _sorted_cutoff(self._dates)
+            self._sorted = self._cutoff is not None
+            self._filter = self._slice_pd if self._sorted else self._mask_pd
+        else:
+            if self._use_index:
+                raise ValueError("polars OracleDataFrames require a date_col since polars DataFrames have no index")
+
+            self._dates = df[date_col]
+
+            # Checked here rather than failing on every access, polars does not compare dates to strings
+            if self._dates.dtype not in (pl.Date, pl.Datetime):
+                raise ValueError(f"the date_col of a polars OracleDataFrame must be a Date or Datetime column, "
+                                 f"got {self._dates.dtype}")
+
+            self._sorted = self._dates.is_sorted()
+
+            if self._sorted:
+                self._df = df.with_columns(pl.col(date_col).set_sorted())
+
+            self._filter = self._slice_pl if self._sorted else self._mask_pl
+            self._cutoff = self._cutoff_pl
+
+    @property
+    def past(self) -> bool:
+        """
+        Whether the OracleDataFrame returns the data before (True) or after (False) the current date.
+        """
+        return self._past
+
+    @past.setter
+    def past(self, past: bool) -> None:
+        self._past = past
+
+        # Views and text cached for the current date were filtered in the previous direction
+        self._clock_cache.clear()
+
     @classmethod
     def pd_from_csv(cls, path: str, date_col="index", past: bool = True, **kwargs):
         """
@@ -98,7 +148,7 @@ class OracleDataFrame:
         return cls(pd.read_csv(path, **kwargs), date_col=date_col, past=past)
 
     @classmethod
-    def pl_from_csv(cls, path: str, date_col="index", past: bool = True, **kwargs):
+    def pl_from_csv(cls, path: str, date_col: str, past: bool = True, **kwargs):
         """
         Create an OracleDataFrame from a CSV file inheriting all the methods and attributes of a Polars DataFrame.
 
@@ -106,55 +156,60 @@ class OracleDataFrame:
         ----------
         path : str
             The path to the CSV file.
-        date_col: str, optional
-            The name of the column containing dates. Defaults to the index.
+        date_col: str
+            The name of the column containing dates.
         past: bool, optional
             If True, the OracleDataFrame will return only the data before the current date.
             If False, it will return only the data after the current date.
         kwargs :
-            Additional keyword arguments to pass to `pl.read
+            Additional keyword arguments to pass to `pl.read_csv`. Dates are parsed with `try_parse_dates=True` unless
+            specified otherwise.
 
         Returns
         -------
         OracleDataFrame
             The OracleDataFrame created from the CSV file.
         """
+        kwargs.setdefault("try_parse_dates", True)
 
-        return cls(pd.read_csv(path, **kwargs), date_col=date_col, past=past)
+        return cls(pl.read_csv(path, **kwargs), date_col=date_col, past=past)
 
+    @_clock_cached
     def _get_filtered_df(self):
-        current_datetime = datetime.datetime.utcnow()
+        return self._filter(clock.get())
 
-        if self.past:
-            if self._date_col == "index":
-                return self._df[self._df.index <= current_datetime]
-            else:
-                return self._df[self._df[self._date_col] <= pd.to_datetime(current_datetime)]
-        else:
-            if self._date_col == "index":
-                return self._df[self._df.index > pd.to_datetime(current_datetime)]
-            else:
-                return self._df[self._df[self._date_col] > pd.to_datetime(current_datetime)]
+    def _slice_pd(self, current_datetime: datetime.datetime):
+        i = self._cutoff(current_datetime)
+        return self._df.iloc[:i] if self._past else self._df.iloc[i:]
 
-    def __getattr__(self, name: str):
-        if name in ['_df', '_date_col', 'past']:
-            return object.__getattribute__(self, name)
+    def _mask_pd(self, current_datetime: datetime.datetime):
+        current_timestamp = pd.Timestamp(current_datetime)
 
-        attr = getattr(self._get_filtered_df(), name)
+        if self._past:
+            return self._df[self._dates <= current_timestamp]
+        else:
+            return self._df[self._dates > current_timestamp]
 
-        # Special attributes that should be returned directly, not wrapped
-        direct_attributes = ['iloc', 'loc', 'at', 'iat']
+    def _cutoff_pl(self, current_datetime: datetime.datetime) -> int:
+        cutoff = pl.Series([current_datetime]).cast(self._dates.dtype)
+        return self._dates.search_sorted(cutoff, side="right")[0]
 
-        if name in direct_attributes:
-            return attr
-        elif callable(attr):
-            def wrapper(*args, **kwargs):
-                result = attr(*args, **kwargs)
-                return result
+    def _slice_pl(self, current_datetime: datetime.datetime):
+        i = self._cutoff_pl(current_datetime)
+        return self._df.slice(0, i) if self._past else self._df.slice(i)
 
-            return wrapper
+    def _mask_pl(self, current_datetime: datetime.datetime):
+        if self._past:
+            return self._df.filter(pl.col(self._date_col) <= current_datetime)
         else:
-            return attr
+            return self._df.filter(pl.col(self._date_col) > current_datetime)
+
+    def __getattr__(self, name: str):
+        # Internal attributes only reach __getattr__ when they are missing, e.g. before __init__ has run
+        if name in _INTERNAL_ATTRIBUTES:
+            raise AttributeError(name)
+
+        return getattr(self._get_filtered_df(), name)
 
     def pop(self, item: Hashable) -> pd.Series | pl.Series:
         raise NotImplementedError("OracleDataFrame does not support item popping")
@@ -163,21 +218,35 @@ class OracleDataFrame:
         return self._get_filtered_df().__getitem__(item)
 
     def __setitem__(self, key, value):
+        _clear_rendered(self._clock_cache)
         return self._get_filtered_df().__setitem__(key, value)
 
     def __delitem__(self, key):
         raise NotImplementedError("OracleDataFrame does not support item deletion")
 
     def __len__(self):
+        # Sorted data only needs the cutoff position, not the sliced frame
+        if self._sorted:
+            i = self._cutoff(clock.get())
+            return i if self._past else len(self._df) - i
+
         return self._get_filtered_df().__len__()
 
     def __iter__(self):
+        # pandas iterates over column labels, which do not depend on the current date. polars yields the column
+        # Series themselves, so it still goes through the filtered frame
+        if isinstance(self._df, pd.DataFrame):
+            return iter(self._df.columns)
+
         return self._get_filtered_df().__iter__()
 
     def __contains__(self, item):
-        return self._get_filtered_df().__contains__(item)
+        return item in self._columns
 
     def __reversed__(self):
+        if isinstance(self._df, pd.DataFrame):
+            return reversed(self._df.columns)
+
         return self._get_filtered_df().__reversed__()
 
     def __missing__(self, key):
@@ -186,8 +255,10 @@ class OracleDataFrame:
     def __hash__(self):
         return self._get_filtered_df().__hash__()
 
+    @_clock_cached
     def __repr__(self):
         return self._get_filtered_df().__repr__()
 
+    @_clock_cached
     def __str__(self):
         return self._get_filtered_df().__str__()
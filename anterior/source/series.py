@@ -4,16 +4,22 @@ from typing import Hashable, Any
 import pandas as pd
 import polars as pl
 
+from anterior import clock
+from ._filter import _clock_cached, _clear_rendered, _sorted_cutoff
+
+_INTERNAL_ATTRIBUTES = frozenset({'_series', '_past', '_cutoff', '_sorted', '_filter', '_clock_cache'})
+
 
 class OracleSeries:
     """
-    Series that inherits all the methods and attributes of a pandas or polars Series,
+    Series that inherits all the methods and attributes of a pandas Series,
     but only returns and modifies data before/after the current date depending on specification.
 
     Parameters
     ----------
-    series : pd.Series | pl.Series
-        The Series to use as the data source.
+    series : pd.Series
+        The Series to use as the data source. Its index holds the dates, so polars Series, which have no index, are
+        rejected with a ValueError.
     past : bool, optional
         If True, the OracleSeries will return only the data before the current date.
         If False, it will return only the data after the current date.
@@ -61,14 +67,37 @@ class OracleSeries:
             ```
     """
 
-    def __init__(self, series: pd.Series | pl.Series, past=True):
+    def __init__(self, series: pd.Series, past=True):
+
+        if isinstance(series, pl.Series):
+            raise ValueError("polars OracleSeries are not supported since polars Series have no index to filter by")
 
-        if not isinstance(series, (pd.Series, pl.Series)):
-            raise ValueError("only pandas or polars OracleSeries are supported")
+        if not isinstance(series, pd.Series):
+            raise ValueError("only pandas OracleSeries are supported")
 
         self._series = series
+        self._clock_cache = {}
         self.past = past
 
+        # The matching filter is picked once here so the hot path does not branch on it
+        self._cutoff = _sorted_cutoff(series.index)
+        self._sorted = self._cutoff is not None
+        self._filter = self._slice if self._sorted else self._mask
+
+    @property
+    def past(self) -> bool:
+        """
+        Whether the OracleSeries returns the data before (True) or after (False) the current date.
+        """
+        return self._past
+
+    @past.setter
+    def past(self, past: bool) -> None:
+        self._past = past
+
+        # Views and text cached for the current date were filtered in the previous direction
+        self._clock_cache.clear()
+
     @classmethod
     def pd_from_csv(cls, path: str, past: bool = True, **kwargs):
         """
@@ -91,91 +120,68 @@ class OracleSeries:
         """
         return cls(pd.read_csv(path, **kwargs),  past=past)
 
-    @classmethod
-    def pl_from_csv(cls, path: str, past: bool = True, **kwargs):
-        """
-        Create an OracleSeries from a CSV file inheriting all the methods and attributes of a Polars Series.
-
-        Parameters
-        ----------
-        path : str
-            The path to the CSV file.
-        past: bool, optional
-            If True, the OracleSeries will return only the data before the current date.
-            If False, it will return only the data after the current date.
-        kwargs :
-            Additional keyword arguments to pass to `pl.read
-
-        Returns
-        -------
-        OracleSeries
-            The OracleSeries created from the CSV file.
-        """
-
-        return cls(pd.read_csv(path, **kwargs), past=past)
-
+    @_clock_cached
     def _get_filtered_series(self):
+        return self._filter(clock.get())
+
+    def _slice(self, current_datetime: datetime.datetime):
+        i = self._cutoff(current_datetime)
+        return self._series.iloc[:i] if self._past else self._series.iloc[i:]
 
-        current_datetime = datetime.datetime.now()
+    def _mask(self, current_datetime: datetime.datetime):
+        current_timestamp = pd.Timestamp(current_datetime)
 
-        if self.past:
-            return self._series[self._series.index <= pd.to_datetime(current_datetime)]
+        if self._past:
+            return self._series[self._series.index <= current_timestamp]
         else:
-            return self._series[self._series.index > pd.to_datetime(current_datetime)]
+            return self._series[self._series.index > current_timestamp]
 
     def __getattr__(self, name: str):
+        if name in _INTERNAL_ATTRIBUTES:
+            raise AttributeError(name)
 
-        if name in ['_series', 'past']:
-            return object.__getattribute__(self, name)
-
-        attr = getattr(self._get_filtered_series(), name)
-
-        # Special attributes that should be returned directly, not wrapped
-        direct_attributes = ['iloc', 'loc', 'at', 'iat']
-
-        if name in direct_attributes:
-            return attr
-        elif callable(attr):
-            def wrapper(*args, **kwargs):
-                result = attr(*args, **kwargs)
-                return result
-
-            return wrapper
-        else:
-            return attr
+        return getattr(self._get_filtered_series(), name)
 
     def pop(self, item: Hashable) -> Any:
         raise NotImplementedError("OracleSeries does not support item popping")
 
     def __getitem__(self, item):
-        return self._get_filtered_df().__getitem__(item)
+        return self._get_filtered_series().__getitem__(item)
 
     def __setitem__(self, key, value):
-        return self._get_filtered_df().__setitem__(key, value)
+        _clear_rendered(self._clock_cache)
+        return self._get_filtered_series().__setitem__(key, value)
 
     def __delitem__(self, key):
         raise NotImplementedError("OracleSeries does not support item deletion")
 
     def __len__(self):
-        return self._get_filtered_df().__len__()
+        # Sorted data only needs the cutoff position, not the sliced series
+        if self._sorted:
+            i = self._cutoff(clock.get())
+            return i if self._past else len(self._series) - i
+
+        return self._get_filtered_series().__len__()
 
     def __iter__(self):
-        return self._get_filtered_df().__iter__()
+        return self._get_filtered_series().__iter__()
 
     def __contains__(self, item):
-        return self._get_filtered_df().__contains__(item)
+        return self._get_filtered_series().__contains__(item)
 
     def __reversed__(self):
-        return self._get_filtered_df().__reversed__()
+        return self._get_filtered_series().__reversed__()
 
     def __missing__(self, key):
-        return self._get_filtered_df().__missing__(key)
+        return self._get_filtered_series().__missing__(key)
 
     def __hash__(self):
-        return self._get_filtered_df().__hash__()
+        return self._get_filtered_series().__hash__()
 
+    @_clock_cached
     def __repr__(self):
-        return self._get_filtered_df().__repr__()
+        return self._get_filtered_series().__repr__()
 
+    @_clock_cached
     def __str__(self):
-        return self._get_filtered_df().__str__()
+        return self._get_filtered_series().__str__()
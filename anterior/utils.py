@@ -1,9 +1,35 @@
 import logging
+import os
 import sys
+from typing import Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 logger: logging.Logger = logging.getLogger('anterior')
-console = Console(file=sys.stdout, force_terminal=True)
-logger.addHandler(RichHandler(tracebacks_show_locals=True, console=console))
\ No newline at end of file
+console: Optional[Console] = None
+
+
+def _init_logger() -> Console:
+    """
+    Creates the shared console and attaches the Rich handler to the anterior logger, once per process.
+
+    :return: the console used for logging and progress output
+    :rtype: Console
+    """
+    global console
+
+    # Terminals always get escape codes, anything else is left to Rich's own detection, which still honours
+    # FORCE_COLOR and notebooks but keeps them out of plain redirected log files
+    if console is None:
+        console = Console(file=sys.stdout, force_terminal=True if sys.stdout.isatty() else None)
+
+    # Guards against stacking duplicate handlers when the package is initialised again, e.g. in worker processes
+    if not logger.handlers:
+        # Rich tracebacks read the source of every frame and, with locals, format every variable in them including
+        # whole DataFrames, so they are opt-in and errors are otherwise logged with plain tracebacks
+        rich_tracebacks = os.environ.get("ANTERIOR_TB_LOCALS") == "1"
+        logger.addHandler(RichHandler(rich_tracebacks=rich_tracebacks, tracebacks_show_locals=rich_tracebacks,
+                                      markup=False, console=console))
+
+    return console
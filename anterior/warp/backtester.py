@@ -1,51 +1,288 @@
+import asyncio
+import concurrent.futures
 import datetime
+import functools
+import heapq
+import itertools
 import logging
 import multiprocessing
-import re
+import sys
+import threading
 import time
 import warnings
-from typing import Callable
+from contextlib import contextmanager
+from typing import Callable, Iterator, Literal
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 import time_machine
-from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.events import EVENT_JOB_REMOVED, EVENT_ALL_JOBS_REMOVED, JobEvent, SchedulerEvent
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import BasePoolExecutor
 from apscheduler.job import Job
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
-from pydantic import BaseModel
-from pydantic import model_validator
+from apscheduler.util import iscoroutinefunction_partial
 from rich.progress import Progress, BarColumn, TimeElapsedColumn, TextColumn, TaskProgressColumn, SpinnerColumn
 from tzlocal import get_localzone
 from urllib3.exceptions import SystemTimeWarning
 
-from anterior import logger, console
-from .schedule import Schedule, _schedule_decorator
+from anterior import clock, logger, console
+from .schedule import Schedule, _schedule_decorator, _RANGE_RE
+
+_warnings_filtered = False
+
+_LOCAL_TZ_NAME = get_localzone().__str__()
+_ZERO_DELTA = datetime.timedelta()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_zoneinfo(name: str) -> ZoneInfo:
+    """
+    Returns the ZoneInfo for a timezone name, shared across all backtesters using it.
+
+    :param str name: IANA name of the timezone
+    :return: the timezone
+    :rtype: ZoneInfo
+    """
+    return ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_dt(s: str, tz_name: str) -> datetime.datetime:
+    """
+    Parses an ISO-8601 string into a timezone-aware datetime, caching the result for repeatedly used dates.
+
+    :param str s: ISO-8601 date or datetime string
+    :param str tz_name: IANA name of the timezone to assume if the string has no offset
+    :return: the parsed datetime
+    :rtype: datetime.datetime
+    """
+    dt = datetime.datetime.fromisoformat(s)
+    return dt.replace(tzinfo=_get_zoneinfo(tz_name)) if dt.tzinfo is None else dt
+
+
+@functools.lru_cache(maxsize=512)
+def _cron_trigger(fields: tuple, tz_name: str) -> CronTrigger:
+    """
+    Returns a cron trigger for the given fields, shared by all schedules with the same fields and timezone.
+
+    :param tuple fields: sorted (name, value) pairs of the cron fields
+    :param str tz_name: IANA name of the trigger's timezone
+    :return: the cron trigger
+    :rtype: CronTrigger
+    """
+    return CronTrigger(**dict(fields), timezone=_get_zoneinfo(tz_name))
+
+
+@functools.lru_cache(maxsize=512)
+def _crontab_trigger(expression: str, tz_name: str) -> CronTrigger:
+    """
+    Returns a cron trigger for the given crontab expression, shared by all schedules with the same expression and
+    timezone.
+
+    :param str expression: crontab expression
+    :param str tz_name: IANA name of the trigger's timezone
+    :return: the cron trigger
+    :rtype: CronTrigger
+    """
+    return CronTrigger.from_crontab(expression, timezone=_get_zoneinfo(tz_name))
+
+
+@functools.lru_cache(maxsize=512)
+def _date_trigger(run_date: datetime.datetime, tz_name: str) -> DateTrigger:
+    """
+    Returns a date trigger for the given datetime, shared by all schedules with the same datetime and timezone.
+
+    :param datetime.datetime run_date: datetime to fire on
+    :param str tz_name: IANA name of the trigger's timezone
+    :return: the date trigger
+    :rtype: DateTrigger
+    """
+    return DateTrigger(run_date=run_date, timezone=_get_zoneinfo(tz_name))
+
+
+def _range_field(name: str, value: str | tuple) -> str:
+    """
+    Converts a range given as an 'a-b' string or a tuple of start and end values into a cron field expression.
+
+    :param str name: name of the cron field, used in error messages
+    :param str | tuple value: range to convert
+    :return: the 'a-b' cron field expression
+    :rtype: str
+    """
+    if isinstance(value, tuple) and len(value) == 2:
+        return "%s-%s" % value
+    elif isinstance(value, str):
+        if not _RANGE_RE.match(value):
+            raise ValueError(f"{name} must be a string in the format 'a-b', where a and b "
+                             f"represent the start and end of the range respectively.")
+        return value
+    else:
+        raise ValueError(f"{name} must be a string in the format 'a-b' or a tuple of start and end values.")
+
+
+def _lazy_jit(condition: Callable) -> Callable:
+    """
+    Wraps a condition function so that it is compiled with numba's `njit` on its first call. Falls back to the plain
+    function with a warning if numba is not installed or cannot compile it.
+
+    :param Callable condition: condition function taking no arguments
+    :return: the wrapped condition function
+    :rtype: Callable
+    """
+    compiled = None
+
+    @functools.wraps(condition)
+    def inner():
+        nonlocal compiled
+
+        if compiled is not None:
+            return compiled()
+
+        # Compiling on the first check keeps numba's warm-up out of the scheduler start-up. Only the compilation is
+        # guarded, so errors raised by the condition itself propagate instead of running it a second time
+        try:
+            import numba
+
+            jitted = numba.njit(cache=True)(condition)
+            jitted.compile(())
+        except Exception as e:
+            logger.warning(f"Could not JIT-compile {condition.__name__}(), running it as regular Python: {e}")
+            jitted = condition
+
+        compiled = jitted
+        return compiled()
+
+    return inner
+
+
+_SHARED_POOLS: dict[int, concurrent.futures.ThreadPoolExecutor] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+class _SharedThreadPoolExecutor(BasePoolExecutor):
+    """
+    Scheduler executor running jobs on a thread pool shared by all backtesters with the same number of workers.
+
+    The pool is shared rather than sized per backtester, so backtesters running live at the same time compete for
+    its threads: with a single worker, a long job in one backtester delays the jobs of all the others, which are
+    skipped once they miss APScheduler's misfire grace time. Backtesters that need to run alongside each other should
+    be given more workers.
 
-warnings.filterwarnings("ignore", category=SystemTimeWarning)
+    :param int workers: number of threads in the shared pool
+    """
 
+    def __init__(self, workers: int):
+        with _SHARED_POOLS_LOCK:
+            pool = _SHARED_POOLS.get(workers)
 
-class BackTester(BaseModel):
-    timezone: str = get_localzone().__str__()
-    function_map: dict = {}
-    _tzinfo: ZoneInfo = None
+            if pool is None:
+                pool = _SHARED_POOLS[workers] = concurrent.futures.ThreadPoolExecutor(workers)
 
-    @model_validator(mode="after")
-    def _model_validator(self):
+        super().__init__(pool)
+
+    def shutdown(self, wait=True):
+        # The pool outlives any single scheduler, since other backtesters may still be submitting to it
+        pass
+
+
+class _InlineAsyncIOExecutor(AsyncIOExecutor):
+    """
+    Scheduler executor running jobs directly on the event loop, instead of handing plain functions to the loop's
+    default thread pool as APScheduler's AsyncIOExecutor does. Coroutine functions are still run as tasks.
+    """
+
+    def _do_submit_job(self, job: Job, run_times: list[datetime.datetime]) -> None:
+        if iscoroutinefunction_partial(job.func):
+            return super()._do_submit_job(job, run_times)
+
+        # Deferred to the next loop iteration, since jobs are submitted while the scheduler holds its job store lock
+        self._eventloop.call_soon(self._run_inline, job, run_times)
+
+    def _run_inline(self, job: Job, run_times: list[datetime.datetime]) -> None:
         try:
-            self._tzinfo = ZoneInfo(self.timezone)
+            events = run_job(job, job._jobstore_alias, run_times, self._logger.name)
+        except BaseException:
+            self._run_job_error(job.id, *sys.exc_info()[1:])
+        else:
+            self._run_job_success(job.id, events)
+
+
+class BackTester:
+    """
+    Schedules functions and runs them live or backtests them over a past period.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The number of threads running live jobs with the "thread" executor. Values below 1 use the number of CPUs
+        minus 2. Defaults to 1. Backtesters with the same number of workers share the same threads, so a long job in
+        one of them can delay and skip the live jobs of others running at the same time.
+    executor : {"thread", "asyncio"}, optional
+        How live jobs are run. "thread" runs them on a thread pool. "asyncio" runs them one at a time directly on the
+        application's asyncio event loop, saving the handoff to a thread for short jobs, so live runs must be started
+        from a coroutine running on that loop and `workers` does not apply. Jobs that block hold up the whole loop.
+        Backtests are not affected. Defaults to "thread".
+    timezone : str, optional
+        The IANA name of the timezone the backtester runs in. Defaults to the system's local timezone.
+    function_map : dict, optional
+        The functions registered with the backtester's decorators, by name.
+
+    Raises
+    ------
+    ValueError
+        If the timezone or executor is invalid.
+    """
+
+    __slots__ = ("timezone", "function_map", "_tzinfo", "_now_cached", "_scheduler", "_job_heap", "_jobs_by_id",
+                 "_job_order", "_job_counter", "_queued_job_ids", "_stale_job_entries")
+
+    def __init__(self, workers: int = 1, executor: Literal["thread", "asyncio"] = "thread",
+                 timezone: str = _LOCAL_TZ_NAME, function_map: Optional[dict] = None, **kwargs):
+        global _warnings_filtered
+
+        # Backtests move the system clock into the past, which urllib3 would otherwise warn about on every request
+        if not _warnings_filtered:
+            warnings.filterwarnings("ignore", category=SystemTimeWarning)
+            _warnings_filtered = True
+
+        # Other keyword arguments, such as a name, are accepted and ignored
+        self.timezone: str = timezone
+        self.function_map: dict = {} if function_map is None else function_map
+
+        try:
+            self._tzinfo: ZoneInfo = _get_zoneinfo(self.timezone)
         except Exception:
             raise ValueError(f"Invalid timezone: {self.timezone}")
 
-    def __init__(self, workers: int = 1, **kwargs):
-        super().__init__(**kwargs)
+        self._now_cached: Optional[datetime.datetime] = None
+        self._job_heap: Optional[list[tuple[datetime.datetime, int, Job]]] = None
+        self._jobs_by_id: dict[str, Job] = {}
+        self._job_order: dict[str, int] = {}
+        self._job_counter: Iterator[int] = itertools.count()
+        self._queued_job_ids: set[str] = set()
+        self._stale_job_entries: int = 0
 
         # =================== Scheduling ===================
         workers = workers if workers > 0 else multiprocessing.cpu_count() - 2
-        # self._scheduler = BlockingScheduler(executors={"default": ThreadPoolExecutor(workers)}, timezone=self._tzinfo)
-        self._scheduler = BackgroundScheduler(executors={"default": ThreadPoolExecutor(workers)}, timezone=self._tzinfo)
+        if executor == "thread":
+            self._scheduler = BackgroundScheduler(executors={"default": _SharedThreadPoolExecutor(workers)},
+                                                  timezone=self._tzinfo)
+        elif executor == "asyncio":
+            # Live jobs run on the application's running event loop instead of a thread pool
+            self._scheduler = AsyncIOScheduler(executors={"default": _InlineAsyncIOExecutor()}, timezone=self._tzinfo)
+        else:
+            raise ValueError(f"Invalid executor: {executor}. Must be either 'thread' or 'asyncio'.")
+
+        self._scheduler.add_listener(self._on_jobs_removed, EVENT_JOB_REMOVED | EVENT_ALL_JOBS_REMOVED)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(timezone={self.timezone!r}, function_map={self.function_map!r})"
 
     def now(self):
         """
@@ -63,8 +300,27 @@ class BackTester(BaseModel):
         - The datetime is the current system time if the backtester is running in live mode.
         """
 
+        if self._now_cached is not None:
+            return self._now_cached
+
         return datetime.datetime.now(tz=self._tzinfo)
 
+    @contextmanager
+    def _freeze_now(self) -> Iterator[datetime.datetime]:
+        """
+        Reads the clock once and makes `now` return that datetime until the context exits.
+
+        :return: the frozen datetime
+        :rtype: Iterator[datetime.datetime]
+        """
+        previous = self._now_cached
+        self._now_cached = datetime.datetime.now(tz=self._tzinfo) if previous is None else previous
+
+        try:
+            yield self._now_cached
+        finally:
+            self._now_cached = previous
+
     def on_start(self):
         """
         Gets called when the backtester starts.
@@ -179,12 +435,14 @@ class BackTester(BaseModel):
             ```
         """
 
-        any_time = any([days, hours, minutes, seconds])
+        any_time = days or hours or minutes or seconds
 
         if any_time:
             if delta is not None:
                 raise ValueError("Cannot provide both a timedelta and individual time intervals.")
             delta = datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+        elif delta is None:
+            delta = _ZERO_DELTA
 
         return self.on(self.now() + delta)
 
@@ -260,24 +518,15 @@ class BackTester(BaseModel):
             ```
         """
 
-        field_dict = {"year": years, "month": months, "day": days, "week": weeks, "day_of_week": days_of_week,
-                      "hour": hours, "minute": minutes, "second": seconds}
-
-        for k, v in field_dict.items():
-            if v is not None:
-                if isinstance(v, tuple) and len(v) == 2:
-                    field_dict[k] = f"{v[0]}-{v[1]}"
-                elif isinstance(v, str):
-                    if not re.match(r"^\w+-\w+$", v):
-                        raise ValueError(f"{k} must be a string in the format 'a-b', where a and b "
-                                         f"represent the start and end of the range respectively.")
-                else:
-                    raise ValueError(f"{k} must be a string in the format 'a-b' or a tuple of start and end values.")
+        fields = (("year", years), ("month", months), ("day", days), ("week", weeks), ("day_of_week", days_of_week),
+                  ("hour", hours), ("minute", minutes), ("second", seconds))
+
+        field_dict = {k: _range_field(k, v) for k, v in fields if v is not None}
 
         if dates is not None:
             field_dict["start_date"], field_dict["end_date"] = dates
 
-        return Schedule(backtester=self, trigger=CronTrigger(**field_dict, timezone=self._tzinfo))
+        return Schedule(backtester=self, trigger=_cron_trigger(tuple(sorted(field_dict.items())), self.timezone))
 
     def cron(self, expression: str):
         """
@@ -312,7 +561,7 @@ class BackTester(BaseModel):
             bt.cron("0 0 1 1 0 0").do(...)     # runs a function every January 1st
             ```
         """
-        return Schedule(self, trigger=CronTrigger.from_crontab(expression, timezone=self._tzinfo))
+        return Schedule(self, trigger=_crontab_trigger(expression, self.timezone))
 
     def on(self, dt: Optional[str | datetime.datetime | datetime.date] = None,
            year: Optional[int] = None, month: Optional[int] = None, day: Optional[int] = None,
@@ -369,7 +618,7 @@ class BackTester(BaseModel):
         bt.on(year=2023, month=1, day=1, hour=10, minute=0).do()
         ```
         """
-        any_date = any([year, month, day, weekday, day_of_week, hour, minute, second])
+        any_date = year or month or day or weekday or day_of_week or hour or minute or second
 
         if isinstance(dt, str):
             dt = datetime.datetime.strptime(dt, "%Y-%m-%d %H:%M:%S")
@@ -377,13 +626,13 @@ class BackTester(BaseModel):
         if dt is not None:
             if any_date:
                 raise ValueError("Cannot provide both a datetime and individual date components.")
-            return Schedule(self, trigger=DateTrigger(run_date=dt, timezone=self._tzinfo))
+            return Schedule(self, trigger=_date_trigger(dt, self.timezone))
         else:
             if not any_date:
                 raise ValueError("Must provide either a datetime or individual date components.")
-            return Schedule(self, trigger=CronTrigger(year=year, month=month, day=day, week=weekday,
-                                                      day_of_week=day_of_week, hour=hour, minute=minute, second=second,
-                                                      timezone=self._tzinfo))
+            fields = (("day", day), ("day_of_week", day_of_week), ("hour", hour), ("minute", minute),
+                      ("month", month), ("second", second), ("week", weekday), ("year", year))
+            return Schedule(self, trigger=_cron_trigger(fields, self.timezone))
 
     def every(self, years: Optional[int] = None, months: Optional[int] = None, days: Optional[int] = None,
               weeks: Optional[int] = None, hours: Optional[int] = None, minutes: Optional[int] = None,
@@ -427,17 +676,18 @@ class BackTester(BaseModel):
             bt.every(minutes=15).do(...)   # runs a function every 15 minutes
             ```
         """
-        field_dict = {"year": years, "month": months, "day": days, "week": weeks, "hour": hours, "minute": minutes,
-                      "second": seconds}
+        fields = (("year", years), ("month", months), ("day", days), ("week", weeks), ("hour", hours),
+                  ("minute", minutes), ("second", seconds))
 
-        for k, v in field_dict.items():
-            if v is not None:
-                if not isinstance(v, int):
-                    raise ValueError(f"{k} must be an integer.")
-                field_dict[k] = f"*/{int(v)}"
-        return Schedule(self, trigger=CronTrigger(**field_dict, timezone=self._tzinfo))
+        for k, v in fields:
+            if v is not None and not isinstance(v, int):
+                raise ValueError(f"{k} must be an integer.")
 
-    def when(self, condition: Callable) -> Schedule:
+        # Formatted as decimal integers, so that int subclasses such as bool give "*/1" rather than "*/True"
+        field_dict = {k: f"*/{v:d}" for k, v in fields if v is not None}
+        return Schedule(self, trigger=_cron_trigger(tuple(sorted(field_dict.items())), self.timezone))
+
+    def when(self, condition: Callable, jit: bool = False) -> Schedule:
         """
         Creates a Schedule object that will trigger when the specified condition function returns True.
 
@@ -445,6 +695,9 @@ class BackTester(BaseModel):
         ----------
         condition : Callable
             The condition function to trigger on. Must return a boolean value when called.
+        jit : bool, optional
+            Whether to compile the condition function with numba on its first call. Requires the `jit` extra and a
+            condition function supported by numba's nopython mode. Defaults to False.
 
         Returns
         -------
@@ -477,9 +730,12 @@ class BackTester(BaseModel):
             (bt.when(condition) & bt.every(hours=1)).do(lambda: print("Conditional hour!"))
             ```
         """
-        return Schedule(self, trigger=CronTrigger(timezone=self._tzinfo), conditions=[condition])
+        if jit:
+            condition = _lazy_jit(condition)
+
+        return Schedule(self, trigger=_cron_trigger((), self.timezone), conditions=[condition])
 
-    def once(self, condition_function: Callable) -> Schedule:
+    def once(self, condition_function: Callable, jit: bool = False) -> Schedule:
         """
         Creates a Schedule object that will trigger only once when the specified condition function returns True.
 
@@ -487,6 +743,9 @@ class BackTester(BaseModel):
         ----------
         condition_function : Callable
             The condition function to trigger on. Must return a boolean value when called.
+        jit : bool, optional
+            Whether to compile the condition function with numba on its first call. Requires the `jit` extra and a
+            condition function supported by numba's nopython mode. Defaults to False.
 
         Returns
         -------
@@ -525,6 +784,9 @@ class BackTester(BaseModel):
             (bt.once(condition) & bt.every(hours=1)).do(lambda: print("Hello, hourly condition!")
             ```
         """
+        if jit:
+            condition_function = _lazy_jit(condition_function)
+
         return Schedule(self, trigger=DateTrigger(run_date=self.now(), timezone=self._tzinfo),
                         conditions=[condition_function], listen_once=True)
 
@@ -565,7 +827,7 @@ class BackTester(BaseModel):
         --------
         - [`after`](site:/#anterior.warp.backtester.BackTester.after): Creates a Schedule object that will trigger after the specified time interval.
         """
-        return _schedule_decorator(self, "every", *args, **kwargs)
+        return _schedule_decorator(self, self.after, *args, **kwargs)
 
     def do_between(self, *args, **kwargs):
         """
@@ -603,7 +865,7 @@ class BackTester(BaseModel):
         --------
         - [`between`](./#anterior.warp.backtester.BackTester.between): Creates a Schedule object that runs a function between a specified time range.
         """
-        return _schedule_decorator(self, "between", *args, **kwargs)
+        return _schedule_decorator(self, self.between, *args, **kwargs)
 
     def do_cron(self, *args, **kwargs):
         """
@@ -641,7 +903,7 @@ class BackTester(BaseModel):
         --------
         - [`cron`](./#anterior.warp.backtester.BackTester.cron): Creates a Schedule object that runs a function on a cron schedule.
         """
-        return _schedule_decorator(self, "cron", *args, **kwargs)
+        return _schedule_decorator(self, self.cron, *args, **kwargs)
 
     def do_on(self, *args, **kwargs):
         """
@@ -679,7 +941,7 @@ class BackTester(BaseModel):
         --------
         - [`on`](./#anterior.warp.backtester.BackTester.on): Creates a Schedule object that will trigger on a specific date or datetime.
         """
-        return _schedule_decorator(self, "on", *args, **kwargs)
+        return _schedule_decorator(self, self.on, *args, **kwargs)
 
     def do_every(self, *args, **kwargs):
         """
@@ -718,15 +980,15 @@ class BackTester(BaseModel):
         --------
         - [`every`](./#anterior.warp.backtester.BackTester.every): Creates a Schedule object that will run every x years/months/days/weeks/hours/minutes/seconds.
         """
-        return _schedule_decorator(self, "every", *args, **kwargs)
+        return _schedule_decorator(self, self.every, *args, **kwargs)
 
-    def get_scheduler(self) -> BlockingScheduler:
+    def get_scheduler(self) -> BackgroundScheduler | AsyncIOScheduler:
         """
         Returns the scheduler object associated with the backtester.
 
         Returns
         -------
-        BlockingScheduler
+        BackgroundScheduler | AsyncIOScheduler
             The scheduler object associated with the backtester.
         """
 
@@ -781,13 +1043,16 @@ class BackTester(BaseModel):
         """
 
         if wait:
-            if isinstance(wait, float):
-                time.sleep(wait)
+            time.sleep(float(wait))
         if self._scheduler.running:
             self._scheduler.shutdown(wait=True)
 
         self.on_stop()
         self._scheduler.remove_all_jobs()
+        self._job_heap = None
+        self._queued_job_ids.clear()
+        self._stale_job_entries = 0
+        clock.set(None)
 
         logger.info(f"Run stopped.")
 
@@ -815,7 +1080,8 @@ class BackTester(BaseModel):
         Raises
         ------
         RuntimeError
-            If the backtester is already running.
+            If the backtester is already running, or if it runs live with the "asyncio" executor outside a running
+            event loop.
 
         See Also
         --------
@@ -913,6 +1179,14 @@ class BackTester(BaseModel):
 
     def _start(self, live: bool = False) -> None:
 
+        # An asyncio scheduler started outside a running loop reports itself as running but never fires any job
+        if live and isinstance(self._scheduler, AsyncIOScheduler):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError("Live runs with the 'asyncio' executor must be started from a running event loop, "
+                                   "e.g. from a coroutine passed to asyncio.run()") from None
+
         self.on_start()
         self._kickstart_functions(live=live)
 
@@ -931,11 +1205,28 @@ class BackTester(BaseModel):
                          TaskProgressColumn(), TimeElapsedColumn(), console=console,
                          refresh_per_second=60, get_time=time_machine.escape_hatch.time.time) as progress:
 
+            clock.set(start.astimezone(self._tzinfo))
             self._start(live=False)
             task = progress.add_task(f"Backtesting", total=int(total_seconds))
 
+            # Queues every job by its first fire datetime, jobs added during the backtest through a Schedule are pushed
+            # by _add_job
+            self._job_heap = []
+
+            # The frozen time only changes when moved below, so it is tracked locally instead of read from the clock
+            now = self.now()
+
+            inactive_jobs = [job for job in self._get_jobs()
+                             if not self._push_job(job, previous_fire_time=getattr(job, "next_run_time", None), now=now)]
+            self._remove_jobs(inactive_jobs)
+
+            # Advances are flushed to the progress bar in batches, updating it on every tick outweighs short jobs
+            pending_advance = 0.0
+            flush_advance = total_seconds / 500
+            last_flush = time.perf_counter()
+
             try:
-                while self.now() < end:
+                while now < end:
 
                     # Gets the next job and its next fire datetime with the current datetime as the now parameter
                     next_jobs, next_fire_datetime = self._get_next_jobs()
@@ -944,12 +1235,19 @@ class BackTester(BaseModel):
                     if not next_fire_datetime or next_fire_datetime > end:
                         break
 
-                    # Updates the progress bar if the next job is scheduled for a later date """
-                    progress.update(task, advance=(next_fire_datetime - self.now()).total_seconds())
-                    time.sleep(1e-10)
+                    # Updates the progress bar if the next job is scheduled for a later date
+                    pending_advance += (next_fire_datetime - now).total_seconds()
+
+                    if pending_advance > flush_advance or time.perf_counter() - last_flush > 0.1:
+                        progress.update(task, advance=pending_advance)
+                        pending_advance = 0.0
+                        last_flush = time.perf_counter()
 
-                    # Moves the frozen time to the last scheduled time
-                    traveller.move_to(next_fire_datetime)
+                    # Moves the frozen time to the last scheduled time, unless jobs added at the current time are next
+                    if next_fire_datetime != now:
+                        traveller.move_to(next_fire_datetime)
+                        clock.set(next_fire_datetime)
+                        now = next_fire_datetime
 
                     for job in next_jobs:
                         # Updates the last job thread and the frozen time to the next job"s fire date
@@ -958,9 +1256,14 @@ class BackTester(BaseModel):
                         # Runs the next job
                         job.func()
 
-                # Updates the progress bar to 100%
-                while not progress.finished:
-                    progress.update(task, advance=60 * 60 * 24)
+                    # Queues the fired jobs again at their following fire datetime
+                    inactive_jobs = [job for job in next_jobs if job.id in self._jobs_by_id and
+                                     not self._push_job(job, previous_fire_time=next_fire_datetime,
+                                                        now=next_fire_datetime)]
+                    self._remove_jobs(inactive_jobs)
+
+                # Updates the progress bar to 100%, including any pending advance and idle time after the last job
+                progress.update(task, completed=int(total_seconds))
 
             except Exception as e:
                 self.stop()
@@ -970,21 +1273,27 @@ class BackTester(BaseModel):
 
     def _kickstart_functions(self, live: bool):
 
-        for _, func in self.function_map.items():
+        # All decorated functions are registered at the same instant, so the clock only has to be read once
+        # Functions run in both modes unless their "live" or "backtest" attribute is set to a falsy value
+        mode = "live" if live else "backtest"
 
-            if live:
-                if not hasattr(func, "live") or (hasattr(func, "live") and getattr(func, "live")):
-                    func(_scheduled=True)
-            else:
-                if not hasattr(func, "backtest") or (hasattr(func, "backtest") and getattr(func, "backtest")):
+        # Snapshots the functions, so that scheduling them cannot change what is being iterated
+        functions = tuple(self.function_map.values())
+
+        with self._freeze_now():
+            for func in functions:
+                if getattr(func, mode, True):
                     func(_scheduled=True)
 
     def _to_datetime(self, dt: datetime.datetime | datetime.date | str) -> Optional[datetime.datetime]:
+        # Aware datetimes are the common case and need no conversion
+        if isinstance(dt, datetime.datetime) and dt.tzinfo is not None:
+            return dt
         if dt is None:
             return None
         if isinstance(dt, str):
-            dt = datetime.datetime.fromisoformat(dt)
-        if isinstance(dt, datetime.date):
+            return _parse_dt(dt, self.timezone)
+        elif not isinstance(dt, datetime.datetime):
             dt = datetime.datetime.combine(dt, datetime.datetime.min.time())
 
         if dt.tzinfo is None:
@@ -992,38 +1301,102 @@ class BackTester(BaseModel):
 
         return dt
 
+    def _add_job(self, func: Callable, trigger: Optional[BaseTrigger] = None, name: Optional[str] = None) -> Job:
+        job = self._scheduler.add_job(func, trigger=trigger, name=name)
+        self._register_job(job)
+
+        # Jobs added while backtesting, e.g. by other jobs, are queued right away
+        if self._job_heap is not None and not self._push_job(job, previous_fire_time=None, now=self.now()):
+            self._remove_job(job.id)
+
+        return job
+
+    def _register_job(self, job: Job) -> None:
+        # The order jobs are added in breaks ties between jobs firing at the same datetime
+        self._jobs_by_id[job.id] = job
+        self._job_order[job.id] = next(self._job_counter)
+
+    def _push_job(self, job: Job, previous_fire_time: Optional[datetime.datetime], now: datetime.datetime) -> bool:
+        fire_datetime = job.trigger.get_next_fire_time(previous_fire_time=previous_fire_time, now=now)
+
+        # Inactive jobs are left for the caller to remove
+        if fire_datetime is None:
+            return False
+
+        # Among jobs firing at the same datetime, the most recently added one is popped first
+        heapq.heappush(self._job_heap, (fire_datetime, -self._job_order[job.id], job))
+        self._queued_job_ids.add(job.id)
+        return True
+
+    def _on_jobs_removed(self, event: JobEvent | SchedulerEvent) -> None:
+        if event.code == EVENT_ALL_JOBS_REMOVED:
+            self._jobs_by_id.clear()
+            self._job_order.clear()
+
+            if self._job_heap is not None:
+                self._job_heap.clear()
+                self._queued_job_ids.clear()
+                self._stale_job_entries = 0
+
+            return
+
+        self._jobs_by_id.pop(event.job_id, None)
+        self._job_order.pop(event.job_id, None)
+
+        # Removed jobs are skipped once they reach the top of the heap, but it is compacted once they make up about
+        # half of it so that removed jobs scheduled far ahead are not held for the rest of the backtest. Only jobs
+        # still in the heap count, fired one-off jobs are removed after being popped
+        if event.job_id in self._queued_job_ids:
+            self._queued_job_ids.discard(event.job_id)
+            self._stale_job_entries += 1
+
+            if self._stale_job_entries > len(self._job_heap) // 2:
+                self._job_heap[:] = [entry for entry in self._job_heap if entry[2].id in self._jobs_by_id]
+                heapq.heapify(self._job_heap)
+                self._stale_job_entries = 0
+
     def _get_jobs(self) -> list:
-        return self._scheduler.get_jobs()
+        # Jobs can also be added straight to the scheduler, so all of its jobs are registered again in the order it
+        # holds them, which is the order they were added in
+        jobs = self._scheduler.get_jobs()
+
+        for job in jobs:
+            self._register_job(job)
+
+        return jobs
 
     def _remove_job(self, job_id: str) -> None:
         self._scheduler.remove_job(job_id)
 
+    def _remove_jobs(self, jobs: list[Job]) -> None:
+        # Removed after iterating, since each removal notifies the listeners and rescans the scheduler's jobs
+        for job in jobs:
+            self._remove_job(job.id)
+
     def _get_next_jobs(self) -> tuple[list[Job], datetime.datetime]:
 
+        heap = self._job_heap
         next_fire_datetime = None
         next_fire_jobs = []
 
-        # iterates through all jobs and find the next job to run
-        for job in self._get_jobs():
+        # Drops the entries of removed jobs until a live job is on top
+        while heap and heap[0][2].id not in self._jobs_by_id:
+            heapq.heappop(heap)
+            self._stale_job_entries -= 1
 
-            if not hasattr(job, "next_run_time"):
-                job.next_run_time = None
+        if heap:
+            next_fire_datetime = heap[0][0]
 
-            fire_datetime = job.trigger.get_next_fire_time(previous_fire_time=job.next_run_time, now=self.now())
+            # Pops all the jobs firing at the earliest datetime
+            while heap and heap[0][0] == next_fire_datetime:
+                _, _, job = heapq.heappop(heap)
 
-            if fire_datetime is None:
-                job.remove()  # Removes inactive jobs
-
-            else:
-                if next_fire_datetime is None or fire_datetime < next_fire_datetime:
-                    next_fire_datetime = fire_datetime
-                    next_fire_jobs = [job]
-                elif fire_datetime == next_fire_datetime:
+                if job.id in self._jobs_by_id:
+                    self._queued_job_ids.discard(job.id)
                     next_fire_jobs.append(job)
+                else:
+                    self._stale_job_entries -= 1
 
-        if next_fire_datetime is not None:
             next_fire_datetime = next_fire_datetime.astimezone(self._tzinfo)
 
-        next_fire_jobs.reverse()
-
         return next_fire_jobs, next_fire_datetime
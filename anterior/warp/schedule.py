@@ -8,13 +8,17 @@ from functools import wraps
 from typing import Iterable, Callable, Self
 from typing import Union, Optional
 
-import time_machine
 from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.combining import OrTrigger, AndTrigger
 from apscheduler.triggers.cron import CronTrigger
 
 from anterior import logger as cubyc_logger
 
+_XTH_WEEKDAY_RE = re.compile(r"^\d+(?:st|nd|rd|th)\s+(?:mon|tue|wed|thu|fri|sat|sun)$")
+_LAST_WEEKDAY_RE = re.compile(r"^last\s+(?:mon|tue|wed|thu|fri|sat|sun)$")
+_RANGE_RE = re.compile(r"^\w+-\w+$")
+_RECURRENT_RE = re.compile(r"^\*/\d+$")
+
 
 def _is_int_or_numeric(value: any):
     """
@@ -35,7 +39,7 @@ def _is_xth_weekday(value: any):
     :return: whether the value is a string of the format "xth mon/tue/wed/thu/fri/sat/sun"
     :rtype: bool
     """
-    return isinstance(value, str) and re.match(r"^\d+(?:st|nd|rd|th)\s+(?:mon|tue|wed|thu|fri|sat|sun)$", value)
+    return isinstance(value, str) and _XTH_WEEKDAY_RE.match(value)
 
 
 def _is_last_weekday(value: any):
@@ -46,7 +50,7 @@ def _is_last_weekday(value: any):
     :return: whether the value is a string of the format "last mon/tue/wed/thu/fri/sat/sun"
     :rtype: bool
     """
-    return isinstance(value, str) and re.match(r"^last\s+(?:mon|tue|wed|thu|fri|sat|sun)$", value)
+    return isinstance(value, str) and _LAST_WEEKDAY_RE.match(value)
 
 
 def _is_range(value: str):
@@ -58,7 +62,7 @@ def _is_range(value: str):
     :rtype: bool
     """
 
-    return re.match(r"\w+-\w+$", value)
+    return _RANGE_RE.match(value)
 
 
 def _is_recurrent(value: str):
@@ -69,12 +73,14 @@ def _is_recurrent(value: str):
     :return: whether the value is a string of the format "*/x"
     :rtype: bool
     """
-    return re.match(r"\*\/\d+$", value)
+    return _RECURRENT_RE.match(value)
 
 
-def _schedule_decorator(scheduler, schedule_type: str, *schedule_args, **schedule_kwargs):
+def _schedule_decorator(scheduler, schedule: Callable, *schedule_args, **schedule_kwargs):
     def decorator(func):
         name = func.__name__
+        # The signature cannot change after decoration, so it is only inspected once
+        has_parameters = len(inspect.signature(func).parameters) > 0
 
         @wraps(func)
         def inner(*args, _scheduled=False, **kwargs):
@@ -82,12 +88,11 @@ def _schedule_decorator(scheduler, schedule_type: str, *schedule_args, **schedul
             if not _scheduled:
                 return func(*args, **kwargs)
 
-            if len(inspect.signature(func).parameters):
+            if has_parameters:
                 raise RuntimeError(f"Functions with parameters cannot be decorated with schedules. "
                                    f"Please use regular schedules.")
 
-            getattr(scheduler, schedule_type)(*schedule_args, **schedule_kwargs).do(lambda: func(*args, **kwargs),
-                                                                                    name=name)
+            schedule(*schedule_args, **schedule_kwargs).do(lambda: func(*args, **kwargs), name=name)
 
         if name not in scheduler.function_map:
             scheduler.function_map[name] = inner
@@ -163,6 +168,8 @@ class Schedule:
     Most users won't need to create a `Schedule` object directly. Instead, use the `@Schedule` decorators or the
     `BackTester` class to create schedules.
     """
+    __slots__ = ("backtester", "trigger", "start_datetime", "end_datetime", "conditions", "listen_once", "job")
+
     def __init__(self, backtester, trigger: BaseTrigger = None, start_datetime=None, end_datetime=None,
                  conditions: Union[Callable, Iterable[Callable]] = None, listen_once=False):
 
@@ -193,13 +200,12 @@ class Schedule:
         return decorator
 
     @staticmethod
-    def _datetime_to_date_dict(dt):
-        return {"year": dt.year, "month": dt.month, "day": dt.day, "hour": dt.hour, "minute": dt.minute,
-                "second": dt.second}
+    def _datetime_to_date_tuple(dt):
+        return dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
 
     @staticmethod
-    def _date_dict_to_datetime(date_dict):
-        return datetime.datetime(**date_dict)
+    def _date_tuple_to_datetime(date_tuple):
+        return datetime.datetime(*date_tuple)
 
     def _listener(self, conditions: Iterable[Callable], execution_function: Callable):
         # Creates a wrapper function that runs the execution function once the condition function is met
@@ -241,7 +247,7 @@ class Schedule:
         elif log:
             function = _func_wrapper(function)
 
-        self.job = self.backtester.get_scheduler().add_job(function, trigger=self.trigger, name=name)
+        self.job = self.backtester._add_job(function, trigger=self.trigger, name=name)
 
         return self
 
@@ -287,7 +293,8 @@ class Schedule:
 
                 trigger_fields[common_key] = "{}/{}".format(range_value, recurrent_value)
 
-            trigger = CronTrigger(**self_fields | other_fields | trigger_fields, timezone=self.trigger.timezone)
+            fields = {**self_fields, **other_fields, **trigger_fields}
+            trigger = CronTrigger(**fields, timezone=self.trigger.timezone)
 
         return Schedule(self.backtester, trigger=trigger, conditions=self.conditions + other.conditions,
                         listen_once=self.listen_once or other.listen_once)
@@ -397,18 +404,13 @@ def _func_wrapper(func):
     @wraps(func)
     def inner(*args, **kwargs):
 
-        if time_machine.escape_hatch.is_travelling():
-            start_time = time_machine.escape_hatch.time.time()
-        else:
-            start_time = time.time()
+        # perf_counter is not frozen by time_machine, so it measures the real duration in backtests too
+        start_time = time.perf_counter()
 
         try:
             func(*args, **kwargs)
 
-            if time_machine.escape_hatch.is_travelling():
-                delta_sec = (time_machine.escape_hatch.time.time() - start_time)
-            else:
-                delta_sec = (time.time() - start_time)
+            delta_sec = time.perf_counter() - start_time
 
             if delta_sec < 1:
                 cubyc_logger.debug(f"{func.__name__}() finished in {delta_sec * 1000} milliseconds",
@@ -416,7 +418,7 @@ def _func_wrapper(func):
             elif delta_sec < 60:
                 cubyc_logger.debug(f"{func.__name__}() finished in {delta_sec} seconds", extra={"markup": True})
             else:
-                cubyc_logger.debug(f"{func.__name__}() finished in {delta_sec * 60} minutes", extra={"markup": True})
+                cubyc_logger.debug(f"{func.__name__}() finished in {delta_sec / 60} minutes", extra={"markup": True})
 
         except Exception as e:
             cubyc_logger.error(f"{func.__name__}() failed with [bold red]{e.__class__.__name__}[/]: {e}",
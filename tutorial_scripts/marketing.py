@@ -30,10 +30,11 @@ model = mmm.DelayedSaturatedMMM(
 
 budget = 0.5
 logs = []
+feature_columns = [c for c in data.columns if c != "y"]
 
 
 def get_budget_allocation():
-    features, targets = data[[c for c in data.columns if c != "y"]], data["y"]
+    features, targets = data[feature_columns], data["y"]
 
     model.fit(features.reset_index(), targets, progressbar=False)
 
@@ -1,5 +1,6 @@
 # --8<-- [start:source]
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pandas as pd
@@ -13,7 +14,9 @@ _api_key = ...  # Your API key here
 def fetch_and_prepare_data(sid):
     url = f"https://api.stlouisfed.org/fred/series/observations?file_type=json" \
           f"&api_key={_api_key}&series_id={sid}"
-    df = pd.read_json(BytesIO(bytes(requests.get(url).text, 'utf-8')), typ='series')["observations"]
+    resp = requests.get(url)
+    resp.raise_for_status()
+    df = pd.read_json(BytesIO(resp.content), typ='series')["observations"]
     df = pd.DataFrame(df)
     df['date'] = pd.to_datetime(df['date'])
     df.set_index('date', inplace=True)
@@ -22,7 +25,8 @@ def fetch_and_prepare_data(sid):
 
 
 series_ids = ["FEDFUNDS", "UNRATE", "CPIAUCSL", "TOTALSA"]
-df = pd.concat([fetch_and_prepare_data(sid) for sid in series_ids], axis=1, join='inner')
+with ThreadPoolExecutor(max_workers=len(series_ids)) as executor:
+    df = pd.concat(executor.map(fetch_and_prepare_data, series_ids), axis=1, join='inner')
 df['month'], df['year'] = df.index.month, df.index.year
 
 data = OracleDataFrame(df)